@@ -40,6 +40,8 @@ async def lifespan(_):
     state.model = capellambse.MelodyModel(**model_spec)
     logger.info("Loading templates from: %s", c.TEMPLATES_DIR)
     reports.load_templates()
+    components.clear_caches()
+    state.reports_page_html = fh.to_xml(components.reports_page())
     state.jinja_env = jinja2.Environment(
         autoescape=True,
         loader=jinja2.FileSystemLoader(c.TEMPLATES_DIR),
@@ -111,7 +113,7 @@ def home(request) -> t.Any:
     page_content = (
         ft.Div(
             components.model_information(),
-            components.reports_page(),
+            fh.NotStr(state.reports_page_html),
             cls="flex flex-col space-y-4 place-items-center mx-auto mb-4",
         ),
         components.bottom_bar(),
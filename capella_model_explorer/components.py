@@ -4,24 +4,292 @@
 from __future__ import annotations
 
 import base64
+import functools
+import html
 import importlib.resources as imr
-import json
 import typing as t
 
+import jinja2
+import markupsafe
+from fasthtml import common as fh
 from fasthtml import ft, svg
+from starlette import routing
 
 import capella_model_explorer
 from capella_model_explorer import app, icons, reports, state
 from capella_model_explorer import constants as c
 
 GITHUB_URL = "https://github.com/DSD-DBS/capella-model-explorer"
+TRIGRAM_SEARCH_THRESHOLD = 500
+"""Number of instances above which searches are pre-filtered by trigrams.
+
+For smaller templates, testing each name directly is fast enough, and
+the trigram comparison would only add overhead.
+"""
+
+_TEMPLATE_CARD = jinja2.Environment(
+    autoescape=True,
+    lstrip_blocks=True,
+    trim_blocks=True,
+).from_string(
+    imr.read_text(__name__.rsplit(".", 1)[0], "template-card.html.j2")
+)
+_CARD_ICONS = {
+    name: markupsafe.Markup(fh.to_xml(getattr(icons, name)()))
+    for name in (
+        "badge_document",
+        "badge_experimental",
+        "badge_stable",
+        "file_stack",
+        "report",
+    )
+}
+
+_TOC_JS = imr.read_text(__name__.rsplit(".", 1)[0], "table-of-contents.js")
+_TOC_CONTAINER_CLS = (
+    "fixed",
+    "top-12",
+    "right-0",
+    "bottom-0",
+    "w-80",
+    "bg-white",
+    "dark:bg-neutral-900",
+    "border-l",
+    "border-neutral-300",
+    "dark:border-neutral-700",
+    "shadow-lg",
+    "transform",
+    "translate-x-full",
+    "xl:translate-x-0",
+    "transition-transform",
+    "duration-300",
+    "z-40",
+    "overflow-y-auto",
+    "pl-4",
+    "xl:relative",
+    "xl:transform-none",
+    "xl:shadow-none",
+    "xl:border-none",
+    "xl:bg-transparent",
+    "xl:dark:bg-transparent",
+    "xl:w-80",
+    "xl:top-0",
+    "xl:overflow-visible",
+    "xl:pl-6",
+    "shrink-0",
+    "print:hidden",
+)
+_TOC_LINK_CLS_BASE = (
+    "block",
+    "text-sm",
+    "text-neutral-700",
+    "dark:text-neutral-400",
+    "hover:text-primary-600",
+    "dark:hover:text-primary-400",
+    "py-1.5",
+    "rounded",
+    "transition-colors",
+    "duration-300",
+    "toc-link",
+)
+_TOC_LINK_CLS = {
+    level: (*_TOC_LINK_CLS_BASE, indent)
+    for level, indent in {
+        1: "ml-0",
+        2: "ml-3",
+        3: "ml-6",
+        4: "ml-9",
+        5: "ml-12",
+        6: "ml-15",
+    }.items()
+}
+
+_MODEL_OBJECT_BUTTON_CLS = (
+    "aria-selected:bg-primary-500",
+    "aria-selected:dark:hover:bg-primary-500",
+    "aria-selected:dark:text-white",
+    "aria-selected:text-white",
+    "bg-neutral-200",
+    "break-words",
+    "cursor-pointer",
+    "dark:bg-neutral-800",
+    "dark:hover:bg-neutral-700",
+    "dark:text-neutral-400",
+    "duration-300",
+    "flex",
+    "flex-col",
+    "hover:bg-primary-50",
+    "hover:scale-[1.02]",
+    "model_object_btn",
+    "p-4",
+    "place-items-left",
+    "rounded-md",
+    "shadow-sm",
+    "text-left",
+    "transition",
+    "w-full",
+)
+_MODEL_OBJECT_BUTTON_ATTRS = (
+    f' class="{" ".join(_MODEL_OBJECT_BUTTON_CLS)}"'
+    ' hx-trigger="click"'
+    ' hx-push-url="true"'
+    ' hx-include="[name=&quot;search&quot;]"'
+    ' hx-target="#template_container"'
+)
+_SEARCH_INPUT_CLS = (
+    "-outline-offset-1",
+    "bg-white",
+    "block",
+    "col-start-1",
+    "dark:bg-neutral-800",
+    "dark:focus:outline-white",
+    "dark:text-neutral-400",
+    "focus:-outline-offset-2",
+    "focus:outline-2",
+    "focus:outline-primary-500",
+    "grow",
+    "outline",
+    "outline-1",
+    "outline-neutral-300",
+    "pl-8",
+    "placeholder:text-neutral-400",
+    "pr-3",
+    "py-1.5",
+    "rounded-md",
+    "row-start-1",
+    "text-neutral-900",
+)
+_TEMPLATE_CONTAINER_CLS = (
+    "bg-white",
+    "dark:bg-neutral-800",
+    "dark:border-b",
+    "dark:lg:border-l",
+    "dark:border-neutral-700",
+    "dark:shadow-neutral-700",
+    "min-h-full",
+    "html-content",
+    "flex",
+    "items-start",
+    "justify-center",
+    "p-4",
+    "print:bg-white",
+    "print:m-0",
+    "print:ml-6",
+    "print:p-0",
+    "svg-display",
+    "template-container",
+    "w-full",
+)
+_SIDEBAR_CLS = (
+    "dark:bg-neutral-900",
+    "flex",
+    "flex-col",
+    "h-full",
+    "lg:max-h-[calc(100vh-12*var(--spacing))]",
+    "lg:w-96",
+    "max-h-[calc(0.85*(100vh-12*var(--spacing)))]",
+    "pl-4",
+    "print:hidden",
+    "py-4",
+    "rounded-lg",
+    "space-y-4",
+    "sticky",
+    "top-0",
+)
+
+_NAVBAR_BUTTONS_HTML = fh.to_xml(
+    (
+        ft.Button(
+            icons.printer(),
+            onclick="window.print();",
+            id="print-button",
+            title="Print report",
+            cls="hidden cursor-pointer",
+        ),
+        ft.Button(
+            icons.toc_icon(),
+            id="toc-toggle-button",
+            title="Toggle table of contents",
+            onclick="toggleToc()",
+            cls="hidden xl:hidden cursor-pointer",
+        ),
+        ft.Button(
+            icons.theme_system(id="dark-mode-icon-system"),
+            icons.theme_dark(id="dark-mode-icon-dark", cls=("hidden",)),
+            icons.theme_light(id="dark-mode-icon-light", cls=("hidden",)),
+            id="dark-mode-button",
+            title="Toggle dark mode",
+            cls="cursor-pointer",
+        ),
+    )
+)
+_VERSION = capella_model_explorer.__version__
+_BOTTOM_BAR_HTML = fh.to_xml(
+    ft.Div(
+        ft.Div(
+            ft.Span(
+                f"Capella-Model-Explorer: v{_VERSION}",
+                cls="dark:text-gray-300",
+            )
+            if "dev" in _VERSION
+            else ft.A(
+                ft.Span(f"Capella-Model-Explorer: v{_VERSION}"),
+                href=f"{GITHUB_URL}/releases/v{_VERSION}",
+                target="_blank",
+                cls="hover:underline dark:text-gray-300",
+            )
+        ),
+        ft.Div(
+            ft.A(
+                ft.Span("Contribute on GitHub"),
+                icons.github_logo(),
+                href=GITHUB_URL,
+                target="_blank",
+                cls="flex items-center gap-2 hover:underline dark:text-gray-300",
+            ),
+            cls="md:w-fit md:mx-auto",
+        ),
+        cls="md:grid md:grid-cols-3 w-full px-2 pb-2",
+    )
+)
+
+_ROUTE_CACHE: dict[tuple[str, frozenset[str]], str] = {}
+
+
+def _url_for(name: str, /, **params: str) -> str:
+    """Build the URL path of a named route.
+
+    This is equivalent to ``app.app.url_path_for()``, but looks up the
+    route only once per name and set of parameters, instead of scanning
+    the whole routing table on every call.
+    """
+    key = (name, frozenset(params))
+    try:
+        path_format = _ROUTE_CACHE[key]
+    except KeyError:
+        for route in app.app.routes:
+            if (
+                isinstance(route, routing.Route)
+                and route.name == name
+                and route.param_convertors.keys() == params.keys()
+            ):
+                break
+        else:
+            raise routing.NoMatchFound(name, params) from None
+        path_format = _ROUTE_CACHE[key] = route.path_format
+    return path_format.format_map(params)
+
+
+def clear_caches() -> None:
+    """Drop the cached model description badge of the loaded model."""
+    _model_badge_uri.cache_clear()
 
 
 def application_shell(
     *content: t.Any,
     template: reports.Template | None,
     element: str | None,
-) -> tuple[ft.Title, ft.Main]:
+) -> tuple[ft.Title, ft.Body]:
     return (
         ft.Title(f"{state.model.name} - Model Explorer"),
         ft.Body(
@@ -53,33 +321,31 @@ def application_shell(
 
 
 def breadcrumb(*, label: str, url: str) -> ft.Li:
-    return (
-        ft.Li(
-            ft.Div(
-                svg.Svg(
-                    svg.Path(d="M.293 0l22 22-22 22h1.414l22-22-22-22H.293z"),
-                    viewbox="0 0 24 44",
-                    preserveaspectratio="none",
-                    aria_hidden="true",
-                    cls="h-full w-6 stroke-1 stroke-primary-400 dark:stroke-neutral-700",
-                ),
-                ft.A(
-                    label,
-                    href=url,
-                    cls=(
-                        "dark:hover:text-neutral-100",
-                        "dark:text-neutral-400",
-                        "font-medium",
-                        "ml-4",
-                        "hover:text-neutral-50",
-                        "text-neutral-300",
-                        "text-sm",
-                    ),
+    return ft.Li(
+        ft.Div(
+            svg.Svg(
+                svg.Path(d="M.293 0l22 22-22 22h1.414l22-22-22-22H.293z"),
+                viewbox="0 0 24 44",
+                preserveaspectratio="none",
+                aria_hidden="true",
+                cls="h-full w-6 stroke-1 stroke-primary-400 dark:stroke-neutral-700",
+            ),
+            ft.A(
+                label,
+                href=url,
+                cls=(
+                    "dark:hover:text-neutral-100",
+                    "dark:text-neutral-400",
+                    "font-medium",
+                    "ml-4",
+                    "hover:text-neutral-50",
+                    "text-neutral-300",
+                    "text-sm",
                 ),
-                cls="flex items-center",
             ),
-            cls="flex",
+            cls="flex items-center",
         ),
+        cls="flex",
     )
 
 
@@ -99,8 +365,8 @@ def breadcrumbs(
                     ft.A(
                         icons.home(),
                         ft.Span("Home", cls="sr-only"),
-                        href=app.app.url_path_for("main_home"),
-                        hx_get=app.app.url_path_for("main_home"),
+                        href=_url_for("main_home"),
+                        hx_get=_url_for("main_home"),
                         hx_target="#root",
                         hx_push_url="true",
                     ),
@@ -110,13 +376,13 @@ def breadcrumbs(
             )
         )
 
-        url = app.app.url_path_for("template_page", template_id=template.id)
+        url = _url_for("template_page", template_id=template.id)
         components.append(breadcrumb(label=template.name, url=url))
 
     if element_id is not None:
         assert template is not None, "Model element passed without template"
         element = state.model.by_uuid(element_id)
-        url = app.app.url_path_for(
+        url = _url_for(
             "template_page",
             template_id=template.id,
             model_element_uuid=element_id,
@@ -136,18 +402,22 @@ def breadcrumbs(
     )
 
 
-def model_information() -> ft.Div:
-    """Render the model information including the badge."""
-    badge = "data:image/svg+xml;base64," + base64.standard_b64encode(
+@functools.cache
+def _model_badge_uri() -> str:
+    return "data:image/svg+xml;base64," + base64.standard_b64encode(
         state.model.description_badge.encode("utf-8")
     ).decode("ascii")
+
+
+def model_information() -> ft.Div:
+    """Render the model information including the badge."""
     return ft.Div(
         ft.H1(state.model.name, cls="text-xl"),
         ft.P(
             f"Capella version: {state.model.info.capella_version}",
         ),
         ft.Img(
-            src=badge,
+            src=_model_badge_uri(),
             alt="Model description badge",
             cls="object-scale-down",
         ),
@@ -173,51 +443,77 @@ def model_information() -> ft.Div:
     )
 
 
-def model_object_button(
-    *, template: reports.Template, model_element: dict, selected: bool = False
-) -> ft.A:
-    return ft.A(
-        ft.Div(model_element["name"]),
-        ft.Div(model_element["uuid"], cls="text-xs text-sky-700")
-        if state.show_uuids
-        else None,
-        id=f"model-element-{model_element['uuid']}",
-        aria_selected="true" if selected else "false",
-        cls=(
-            "aria-selected:bg-primary-500",
-            "aria-selected:dark:hover:bg-primary-500",
-            "aria-selected:dark:text-white",
-            "aria-selected:text-white",
-            "bg-neutral-200",
-            "break-words",
-            "cursor-pointer",
-            "dark:bg-neutral-800",
-            "dark:hover:bg-neutral-700",
-            "dark:text-neutral-400",
-            "duration-300",
-            "flex",
-            "flex-col",
-            "hover:bg-primary-50",
-            "hover:scale-[1.02]",
-            "model_object_btn",
-            "p-4",
-            "place-items-left",
-            "rounded-md",
-            "shadow-sm",
-            "text-left",
-            "transition",
-            "w-full",
-        ),
-        hx_trigger="click",
-        hx_get=app.app.url_path_for(
-            "template_page",
-            template_id=template.id,
-            model_element_uuid=model_element["uuid"],
-        ),
-        hx_push_url="true",
-        hx_include='[name="search"]',
-        hx_target="#template_container",
-    )
+def _render_model_list_html(
+    base_url: str,
+    rows: t.Iterable[dict],
+    selected_id: str | None,
+    *,
+    show_uuids: bool,
+) -> str:
+    """Render the buttons for a list of model elements as HTML.
+
+    This is the hottest render path, as the list is rebuilt on every
+    keystroke in the search field. The markup is therefore assembled
+    directly, instead of going through one ft object per element.
+
+    The ``base_url`` is the template page URL with ``__UUID__`` in place
+    of the model element's UUID.
+    """
+    base_url = html.escape(base_url)
+    parts: list[str] = []
+    append = parts.append
+    for obj in rows:
+        uuid = html.escape(obj["uuid"])
+        selected = "true" if obj["uuid"] == selected_id else "false"
+        uuid_div = (
+            f'<div class="text-xs text-sky-700">{uuid}</div>'
+            if show_uuids
+            else ""
+        )
+        append(
+            f'<a href="#" id="model-element-{uuid}"'
+            f' name="model-element-{uuid}" aria-selected="{selected}"'
+            f' hx-get="{base_url.replace("__UUID__", uuid)}"'
+            f"{_MODEL_OBJECT_BUTTON_ATTRS}>"
+            f"<div>{html.escape(obj['name'])}</div>{uuid_div}</a>"
+        )
+    return "".join(parts)
+
+
+def _filter_instances(
+    template: reports.Template, search_words: list[str]
+) -> list[dict]:
+    """Select the instances whose lowercased name contains all words."""
+    index: t.Iterable[tuple[str, dict]] = template.sorted_lowercase_instances
+    if template.instance_count > TRIGRAM_SEARCH_THRESHOLD:
+        query = frozenset().union(*map(reports.trigrams, search_words))
+        if not query <= template.all_name_trigrams:
+            return []
+        # A single word is matched faster by the substring test alone
+        if query and len(search_words) > 1:
+            index = [
+                entry
+                for entry, grams in zip(
+                    template.sorted_lowercase_instances,
+                    template.name_trigrams,
+                    strict=True,
+                )
+                if query <= grams
+            ]
+
+    if len(search_words) == 1:
+        (word,) = search_words
+        return [obj for name, obj in index if word in name]
+
+    matches: list[dict] = []
+    append = matches.append
+    for name, obj in index:
+        for word in search_words:
+            if word not in name:
+                break
+        else:
+            append(obj)
+    return matches
 
 
 def model_elements_list(
@@ -227,20 +523,25 @@ def model_elements_list(
     search: str = "",
 ) -> ft.Div:
     search_words = search.lower().split()
-    model_elements = [
-        obj
-        for obj in sorted(template.instances, key=lambda x: x["name"])
-        if (n := obj["name"].lower()) and all(w in n for w in search_words)
-    ]
+    model_elements: t.Sequence[dict]
+    if not search_words:
+        model_elements = template.sorted_instances
+    else:
+        model_elements = _filter_instances(template, search_words)
+    base_url = _url_for(
+        "template_page",
+        template_id=template.id,
+        model_element_uuid="__UUID__",
+    )
     return ft.Div(
         ft.Div(
-            *(
-                model_object_button(
-                    template=template,
-                    model_element=model_element,
-                    selected=model_element["uuid"] == selected_id,
+            fh.NotStr(
+                _render_model_list_html(
+                    base_url,
+                    model_elements,
+                    selected_id,
+                    show_uuids=state.show_uuids,
                 )
-                for model_element in model_elements
             ),
             cls="flex flex-col space-y-4 pl-2 pr-4 my-2",
         ),
@@ -252,28 +553,7 @@ def model_elements_list(
 def navbar(template: reports.Template | None, element: str | None) -> ft.Nav:
     return ft.Nav(
         breadcrumbs(template, element),
-        ft.Button(
-            icons.printer(),
-            onclick="window.print();",
-            id="print-button",
-            title="Print report",
-            cls="hidden cursor-pointer",
-        ),
-        ft.Button(
-            icons.toc_icon(),
-            id="toc-toggle-button",
-            title="Toggle table of contents",
-            onclick="toggleToc()",
-            cls="hidden xl:hidden cursor-pointer",
-        ),
-        ft.Button(
-            icons.theme_system(id="dark-mode-icon-system"),
-            icons.theme_dark(id="dark-mode-icon-dark", cls=("hidden",)),
-            icons.theme_light(id="dark-mode-icon-light", cls=("hidden",)),
-            id="dark-mode-button",
-            title="Toggle dark mode",
-            cls="cursor-pointer",
-        ),
+        fh.NotStr(_NAVBAR_BUTTONS_HTML),
         id="page-header",
         cls=(
             "bg-primary-500",
@@ -296,6 +576,16 @@ def navbar(template: reports.Template | None, element: str | None) -> ft.Nav:
     )
 
 
+@functools.lru_cache(maxsize=4096)
+def _rendered_report_url(
+    template_id: str, model_element_uuid: str | None
+) -> str:
+    return app.rendered_report.to(
+        template_id=template_id,
+        model_element_uuid=model_element_uuid,
+    )
+
+
 def report_placeholder(
     template: reports.Template | None,
     model_element_uuid: str | None,
@@ -310,16 +600,14 @@ def report_placeholder(
         )
 
     else:
-        render_environment = reports.compute_cache_key(template)
-        headers = json.dumps({"Render-Environment": render_environment})
+        headers = reports.render_environment_headers(
+            reports.compute_cache_key(template)
+        )
 
         ph_content = ft.Div(
             icons.spinner(),
             hx_trigger="click" if c.DEBUG_SPINNER else "load",
-            hx_get=app.rendered_report.to(
-                template_id=template.id,
-                model_element_uuid=model_element_uuid,
-            ),
+            hx_get=_rendered_report_url(template.id, model_element_uuid),
             hx_headers=headers,
             hx_target="#template_container",
             cls="flex justify-center place-items-center h-full w-full",
@@ -359,29 +647,7 @@ def search_field(template: reports.Template, search: str) -> ft.Div:
             name="search",
             placeholder="Search",
             value=search,
-            cls=(
-                "-outline-offset-1",
-                "bg-white",
-                "block",
-                "col-start-1",
-                "dark:bg-neutral-800",
-                "dark:focus:outline-white",
-                "dark:text-neutral-400",
-                "focus:-outline-offset-2",
-                "focus:outline-2",
-                "focus:outline-primary-500",
-                "grow",
-                "outline",
-                "outline-1",
-                "outline-neutral-300",
-                "pl-8",
-                "placeholder:text-neutral-400",
-                "pr-3",
-                "py-1.5",
-                "rounded-md",
-                "row-start-1",
-                "text-neutral-900",
-            ),
+            cls=_SEARCH_INPUT_CLS,
             hx_trigger="input changed delay:20ms, search",
             hx_get=app.model_object_list.to(
                 template_id=template.id,
@@ -404,165 +670,10 @@ def search_field(template: reports.Template, search: str) -> ft.Div:
     )
 
 
-def template_card(template: reports.Template) -> ft.A:
-    url = app.app.url_path_for("template_page", template_id=template.id)
-
-    chips = []
-    if template.isExperimental:
-        c = ft.Div(
-            icons.badge_experimental(),
-            ft.P("Experimental"),
-            cls=(
-                "bg-yellow-100",
-                "border",
-                "border-yellow-800",
-                "dark:border-yellow-600",
-                "dark:bg-yellow-900",
-                "dark:text-yellow-300",
-                "flex",
-                "flex-row",
-                "font-medium",
-                "max-h-7",
-                "me-2",
-                "px-2.5",
-                "py-1",
-                "rounded-full",
-                "space-x-2",
-                "text-xs",
-                "text-yellow-800",
-            ),
-        )
-        chips.append(c)
-
-    if template.isStable:
-        c = ft.Div(
-            icons.badge_stable(),
-            ft.P("Stable"),
-            cls=(
-                "bg-green-100",
-                "border",
-                "border-green-800",
-                "dark:bg-green-700",
-                "dark:border-green-500",
-                "dark:text-green-200",
-                "flex",
-                "flex-row",
-                "font-medium",
-                "max-h-7",
-                "me-2",
-                "px-2.5",
-                "py-1",
-                "rounded-full",
-                "space-x-2",
-                "text-green-800",
-                "text-xs",
-            ),
-        )
-        chips.append(c)
-
-    if template.isDocument:
-        c = ft.Div(
-            icons.badge_document(),
-            ft.P("Document"),
-            cls=(
-                "bg-blue-200",
-                "border",
-                "border-blue-800",
-                "dark:bg-blue-700",
-                "dark:border-blue-400",
-                "dark:text-blue-200",
-                "flex",
-                "flex-row",
-                "font-medium",
-                "max-h-7",
-                "me-2",
-                "px-2.5",
-                "py-1",
-                "rounded-full",
-                "space-x-2",
-                "text-blue-800",
-                "text-xs",
-            ),
-        )
-        chips.append(c)
-
-    if chips:
-        chip_container = ft.Div(
-            *chips, cls="flex flex-row grow place-items-end p-4"
-        )
-    else:
-        chip_container = None
-
-    return ft.A(
-        ft.Div(
-            ft.Div(
-                template.name,
-                cls="text-neutral-100 dark:text-neutral-400 text-2xl",
-            ),
-            ft.Div(
-                icons.file_stack()
-                if template.instance_count > 1
-                else icons.report(),
-                ft.Span(
-                    template.instance_count,
-                    cls="hidden" if template.instance_count <= 1 else "block",
-                ),
-                cls=(
-                    "dark:text-neutral-400",
-                    "flex",
-                    "flex-row",
-                    "items-top",
-                    "pt-2",
-                    "space-x-2",
-                    "text-primary-50",
-                ),
-            ),
-            cls=(
-                "_template-card-header",
-                "bg-primary-500",
-                "dark:bg-neutral-900",
-                "flex",
-                "flex-row",
-                "justify-between",
-                "p-4",
-                "rounded-t-lg",
-            ),
-        ),
-        ft.P(
-            template.description,
-            cls=(
-                "_template-card-description",
-                "dark:text-neutral-300",
-                "p-4",
-                "text-left",
-                "text-neutral-800",
-            ),
-        ),
-        chip_container,
-        cls=(
-            "_template-card",
-            "active:border-blue-600",
-            "bg-white",
-            "dark:bg-neutral-800",
-            "dark:hover:bg-neutral-700",
-            "dark:shadow-neutral-900",
-            "dark:shadow-xs",
-            "duration-300",
-            "flex",
-            "flex-col",
-            "hover:bg-primary-50",
-            "hover:cursor-pointer",
-            "hover:scale-105",
-            "m-4",
-            "rounded-lg",
-            "shadow-lg",
-            "transition",
-            "w-80",
-        ),
-        href=url,
-        hx_get=url,
-        hx_target="#root",
-        hx_push_url="true",
+def template_card(template: reports.Template) -> fh.NotStr:
+    url = _url_for("template_page", template_id=template.id)
+    return fh.NotStr(
+        _TEMPLATE_CARD.render(template=template, url=url, icons=_CARD_ICONS)
     )
 
 
@@ -608,27 +719,7 @@ def template_container(content: t.Any) -> ft.Div:
     return ft.Div(
         content,
         id="template_container",
-        cls=(
-            "bg-white",
-            "dark:bg-neutral-800",
-            "dark:border-b",
-            "dark:lg:border-l",
-            "dark:border-neutral-700",
-            "dark:shadow-neutral-700",
-            "min-h-full",
-            "html-content",
-            "flex",
-            "items-start",
-            "justify-center",
-            "p-4",
-            "print:bg-white",
-            "print:m-0",
-            "print:ml-6",
-            "print:p-0",
-            "svg-display",
-            "template-container",
-            "w-full",
-        ),
+        cls=_TEMPLATE_CONTAINER_CLS,
     )
 
 
@@ -661,22 +752,7 @@ def template_sidebar(
             search=search,
         ),
         id="template-sidebar",
-        cls=(
-            "dark:bg-neutral-900",
-            "flex",
-            "flex-col",
-            "h-full",
-            "lg:max-h-[calc(100vh-12*var(--spacing))]",
-            "lg:w-96",
-            "max-h-[calc(0.85*(100vh-12*var(--spacing)))]",
-            "pl-4",
-            "print:hidden",
-            "py-4",
-            "rounded-lg",
-            "space-y-4",
-            "sticky",
-            "top-0",
-        ),
+        cls=_SIDEBAR_CLS,
         hx_swap_oob=oob and "morph",
     )
 
@@ -709,104 +785,23 @@ def table_of_contents(toc_items: list[dict]) -> ft.Div:
             ),
             cls="xl:sticky xl:top-4 h-full xl:h-auto",
         ),
-        ft.Script(
-            imr.read_text(__name__.rsplit(".", 1)[0], "table-of-contents.js")
-        ),
+        ft.Script(_TOC_JS),
         id="table-of-contents",
-        cls=(
-            "fixed",
-            "top-12",
-            "right-0",
-            "bottom-0",
-            "w-80",
-            "bg-white",
-            "dark:bg-neutral-900",
-            "border-l",
-            "border-neutral-300",
-            "dark:border-neutral-700",
-            "shadow-lg",
-            "transform",
-            "translate-x-full",
-            "xl:translate-x-0",
-            "transition-transform",
-            "duration-300",
-            "z-40",
-            "overflow-y-auto",
-            "pl-4",
-            "xl:relative",
-            "xl:transform-none",
-            "xl:shadow-none",
-            "xl:border-none",
-            "xl:bg-transparent",
-            "xl:dark:bg-transparent",
-            "xl:w-80",
-            "xl:top-0",
-            "xl:overflow-visible",
-            "xl:pl-6",
-            "shrink-0",
-            "print:hidden",
-        ),
+        cls=_TOC_CONTAINER_CLS,
     )
 
 
 def toc_item(item: dict) -> ft.Li:
-    indent_map = {
-        1: "ml-0",
-        2: "ml-3",
-        3: "ml-6",
-        4: "ml-9",
-        5: "ml-12",
-        6: "ml-15",
-    }
     return ft.Li(
         ft.A(
             item["text"],
             href=f"#{item['id']}",
-            cls=(
-                "block",
-                "text-sm",
-                "text-neutral-700",
-                "dark:text-neutral-400",
-                "hover:text-primary-600",
-                "dark:hover:text-primary-400",
-                "py-1.5",
-                "rounded",
-                "transition-colors",
-                "duration-300",
-                "toc-link",
-                indent_map[item["level"]],
-            ),
+            cls=_TOC_LINK_CLS[item["level"]],
             data_target=item["id"],
         ),
     )
 
 
-def bottom_bar() -> ft.Div:
+def bottom_bar() -> fh.NotStr:
     """Return container for bottom bar."""
-    version = capella_model_explorer.__version__
-    if "dev" in version:
-        version_element = ft.Span(
-            f"Capella-Model-Explorer: v{version}", cls="dark:text-gray-300"
-        )
-    else:
-        version_element = ft.A(
-            ft.Span(f"Capella-Model-Explorer: v{version}"),
-            href=f"{GITHUB_URL}/releases/v{version}",
-            target="_blank",
-            cls="hover:underline dark:text-gray-300",
-        )
-
-    return ft.Div(
-        ft.Div(version_element),
-        ft.Div(
-            ft.A(
-                ft.Span("Contribute on GitHub"),
-                icons.github_logo(),
-                href=GITHUB_URL,
-                target="_blank",
-                cls="flex items-center gap-2 hover:underline dark:text-gray-300",
-            ),
-            cls="md:w-fit md:mx-auto",
-        ),
-        cls="md:grid md:grid-cols-3 w-full px-2 pb-2",
-    )
+    return fh.NotStr(_BOTTOM_BAR_HTML)
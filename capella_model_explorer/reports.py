@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import base64
+import functools
 import json
 import logging
 import operator
@@ -79,6 +80,34 @@ class Template(p.BaseModel):
     def model_post_init(self, _):
         self._compute_instances()
 
+    @functools.cached_property
+    def sorted_lowercase_instances(self) -> tuple[tuple[str, dict], ...]:
+        """Instances with their lowercased names, sorted by name.
+
+        Instances without a name are left out, as they can never match a
+        search.
+        """
+        return tuple(
+            (n, obj)
+            for obj in sorted(self.instances, key=lambda x: x["name"])
+            if (n := obj["name"].lower())
+        )
+
+    @functools.cached_property
+    def sorted_instances(self) -> tuple[dict, ...]:
+        """Named instances, sorted by name."""
+        return tuple(obj for _, obj in self.sorted_lowercase_instances)
+
+    @functools.cached_property
+    def name_trigrams(self) -> tuple[frozenset[str], ...]:
+        """Trigrams of each name in the ``sorted_lowercase_instances``."""
+        return tuple(trigrams(n) for n, _ in self.sorted_lowercase_instances)
+
+    @functools.cached_property
+    def all_name_trigrams(self) -> frozenset[str]:
+        """Union of the trigrams of all instance names."""
+        return frozenset().union(*self.name_trigrams)
+
     def _compute_instances(self) -> None:
         if self.single:
             self.instance_count = 1
@@ -183,6 +212,11 @@ class TemplateCategory(p.BaseModel):
     )
 
 
+def trigrams(text: str, /) -> frozenset[str]:
+    """Return the set of all three-character substrings of a text."""
+    return frozenset(text[i : i + 3] for i in range(len(text) - 2))
+
+
 def template_by_id(id_: str) -> Template | None:
     for template in state.templates:
         if template.id == id_:
@@ -320,8 +354,7 @@ def diagram_placeholder(
             ) from None
         url = f"{url}?params={params}"
 
-    render_environment = compute_cache_key(None)
-    headers = json.dumps({"Render-Environment": render_environment})
+    headers = render_environment_headers(compute_cache_key(None))
 
     return SVG_PLACEHOLDER_MARKUP.format(url=url, headers=headers)
 
@@ -363,6 +396,12 @@ def compute_cache_key(template: Template | None, /) -> str:
     return json.dumps(data)
 
 
+@functools.lru_cache(maxsize=256)
+def render_environment_headers(render_environment: str, /) -> str:
+    """Serialize the htmx headers carrying a render environment."""
+    return json.dumps({"Render-Environment": render_environment})
+
+
 def process_html_with_toc(html_content: str) -> tuple[str, list[dict]]:
     """Process HTML to extract TOC and inject IDs in a single pass."""
     if not html_content.strip():
@@ -28,3 +28,4 @@ show_uuids: bool = False
 
 templates: list[reports.Template] = []
 template_categories: list[reports.TemplateCategory] = []
+reports_page_html: str
@@ -0,0 +1,108 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import pathlib
+import random
+
+import pytest
+
+from capella_model_explorer import components, reports
+
+WORDS = (
+    "actor",
+    "component",
+    "data",
+    "exchange",
+    "function",
+    "interface",
+    "link",
+    "logical",
+    "node",
+    "physical",
+    "port",
+    "system",
+)
+
+
+def _make_template() -> reports.Template:
+    rng = random.Random(0)
+    instances = [
+        {
+            "uuid": f"uuid-{i}",
+            "name": " ".join(rng.choice(WORDS).title() for _ in range(3))
+            + f" {i}",
+        }
+        for i in range(components.TRIGRAM_SEARCH_THRESHOLD + 100)
+    ]
+    instances += [{"uuid": "exact", "name": "Port"}]
+    instances += [{"uuid": "nameless-1", "name": ""}]
+    instances += [{"uuid": "nameless-2", "name": ""}]
+    return reports.Template(
+        id="test",
+        name="Test",
+        category="Test",
+        description="Test template",
+        path=pathlib.Path("test.html.j2"),
+        instances=instances,
+    )
+
+
+TEMPLATE = _make_template()
+
+
+def _naive_filter(
+    template: reports.Template, search_words: list[str]
+) -> list[dict]:
+    return [
+        obj
+        for obj in sorted(template.instances, key=lambda x: x["name"])
+        if (n := obj["name"].lower()) and all(w in n for w in search_words)
+    ]
+
+
+def test_template_is_above_trigram_threshold():
+    assert TEMPLATE.instance_count > components.TRIGRAM_SEARCH_THRESHOLD
+
+
+@pytest.mark.parametrize(
+    "search",
+    [
+        pytest.param("func", id="single word"),
+        pytest.param("ical", id="single word, infix"),
+        pytest.param("a", id="single character"),
+        pytest.param("12", id="short word"),
+        pytest.param("func comp", id="two words"),
+        pytest.param("data link port", id="three words"),
+        pytest.param("lo 12", id="long and short word"),
+        pytest.param("po 1", id="only short words"),
+        pytest.param("system system", id="repeated word"),
+        pytest.param("port or", id="all trigrams of a name"),
+        pytest.param("sys xyz", id="one word without match"),
+    ],
+)
+def test_filter_instances_matches_naive_filter(search: str):
+    search_words = search.lower().split()
+
+    actual = components._filter_instances(TEMPLATE, search_words)
+
+    assert actual == _naive_filter(TEMPLATE, search_words)
+
+
+def test_filter_instances_returns_early_if_trigrams_are_unknown():
+    search_words = ["xyzzy"]
+    assert not reports.trigrams("xyzzy") <= TEMPLATE.all_name_trigrams
+
+    actual = components._filter_instances(TEMPLATE, search_words)
+
+    assert actual == []
+
+
+def test_filter_instances_skips_nameless_instances():
+    search_words = ["a"]
+
+    actual = components._filter_instances(TEMPLATE, search_words)
+
+    assert actual
+    assert all(obj["name"] for obj in actual)
+    uuids = {obj["uuid"] for obj in TEMPLATE.sorted_instances}
+    assert not uuids & {"nameless-1", "nameless-2"}